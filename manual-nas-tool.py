@@ -4,17 +4,23 @@
 # and Rclone for simple, incremental file copies, with enhanced user controls.
 
 import os
+import atexit
+import base64
+import json
 import subprocess
 import sys
 import time
 import shutil
 import signal
 import re
-import random
-import string
+import secrets
+import select
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime
-import threading
+import urllib.request
+from collections import deque
 
 # ====== COLORS & ICONS ======
 GREEN = "\033[92m"
@@ -31,13 +37,35 @@ ERR = f"{RED}❌{RESET}"
 INFO = f"{BLUE}ℹ️{RESET}"
 PROG = f"{CYAN}📦{RESET}"
 
+# Spinner frames are pre-encoded and written straight to the binary stdout.
+_SPINNER_FRAMES = [f"\r{PROG} {c} ".encode() for c in "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"]
+_SPINNER_INTERVAL = 0.2
+
+_BOX_WIDTH = 60
+_BOX_BORDER_TOP = f"{WARN}┌{'─' * _BOX_WIDTH}┐{RESET}"
+_BOX_BLANK_LINE = f"{WARN}│{' ' * _BOX_WIDTH}│{RESET}"
+_BOX_BORDER_BOTTOM = f"{WARN}└{'─' * _BOX_WIDTH}┘{RESET}"
+
 # ====== GLOBALS ======
 current_operation = ""
+_spinner_i = 0
+_spinner_sec = -1
+_spinner_elapsed = "00:00:00"
 start_time = None
 backup_passwords = {}
+rclone_rc = None
 SCRIPT_PATH = os.path.realpath(__file__)
 COMMAND_NAME = "manual-nas-tool"
-INSTALL_PATH = os.path.expanduser(f"~/.local/bin/{COMMAND_NAME}")
+_HOME = os.path.expanduser("~")
+_USER = os.getenv('USER', '')
+_MEDIA_PATH = f"/run/media/{_USER}"
+INSTALL_PATH = os.path.join(_HOME, ".local", "bin", COMMAND_NAME)
+
+_NAME_STRIP = re.compile(r'[^\w\s-]')
+_NAME_COLLAPSE = re.compile(r'[\s_-]+')
+# Restic output meaning the target repository has not been initialized yet.
+RESTIC_NO_REPO = ("unable to open config file", "Is there a repository at the following location?",
+                  "repository does not exist")
 
 # ====== GENERAL HELPERS ======
 
@@ -53,64 +81,190 @@ signal.signal(signal.SIGTERM, cleanup)
 def normalize_name(name):
     """Normalize a string to be used as a safe directory name."""
     name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
-    name = re.sub(r'[^\w\s-]', '', name).strip().lower()
-    name = re.sub(r'[\s_-]+', '_', name)
+    name = _NAME_STRIP.sub('', name).strip().lower()
+    name = _NAME_COLLAPSE.sub('_', name)
     return name
 
-def run_cmd(cmd, env_vars=None):
-    """Execute a shell command, returning (success, output)."""
+def list_dirs(path):
+    """Return the sorted names of the directories in `path` ([] if missing)."""
+    try:
+        with os.scandir(path) as it:
+            return sorted(e.name for e in it if e.is_dir())
+    except FileNotFoundError:
+        return []
+
+def child_env(env_vars=None):
+    """Build a child environment; None lets the child inherit ours as-is."""
+    if not env_vars:
+        return None
+    env = os.environ.copy()
+    env.update(env_vars)
+    return env
+
+def run_cmd(cmd, env_vars=None, discard_output=False):
+    """Execute a command given as an argv list, returning (success, output)."""
     try:
-        env = os.environ.copy()
-        if env_vars:
-            env.update(env_vars)
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, env=env)
+        if discard_output:
+            result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL, env=child_env(env_vars))
+            return result.returncode == 0, ""
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True, env=child_env(env_vars))
         return result.returncode == 0, result.stdout.strip()
     except Exception:
         return False, "Failed to execute command."
 
-def run_cmd_with_progress(cmd, operation, log_file, env_vars=None):
-    """Execute a long-running command and show a progress spinner."""
+def report_failure(operation, output_lines):
+    """Print a failed operation with the last lines of its output."""
+    details = "".join(f"\n  {line}" for line in output_lines[-5:])
+    print(f"{ERR} {operation} failed!\nError details (last 5 lines):{details}")
+
+def run_cmd_with_progress(cmd, operation, log_file, env_vars=None, show_errors=True,
+                          summary_filter=None, summary_max=10, spinner=True):
+    """Execute a long-running command and show a progress spinner.
+
+    Returns (success, lines): on success, the last `summary_max` output lines
+    accepted by `summary_filter` (or the last lines of output if no filter is
+    given); on failure, the last lines of output. Pass spinner=False when
+    other commands run at the same time.
+    """
     print(f"\n{INFO} Starting {operation}...")
-    show_progress(operation)
-    
-    with open(log_file, 'a') as f:
-        f.write(f"[{datetime.now().strftime('%H:%M:%S')}] Executing: {cmd}\n")
+    if spinner: show_progress(operation)
 
-    output_lines = []
+    # Output is streamed straight into the log as raw bytes; only the last
+    # few lines and the summary matches are kept in memory.
+    tail = deque(maxlen=5)
+    summary = deque(maxlen=summary_max)
     success = False
-    try:
-        env = os.environ.copy()
-        if env_vars:
-            env.update(env_vars)
-        process = subprocess.Popen(
-            cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-            universal_newlines=True, env=env
-        )
-        for line in iter(process.stdout.readline, ''):
-            output_lines.append(line.strip())
-        process.wait()
-        success = process.returncode == 0
-    except Exception as e:
-        success = False
-        output_lines.append(str(e))
 
-    stop_progress()
-    
-    with open(log_file, 'a') as f:
+    def collect(lines):
+        tail.extend(lines)
+        if summary_filter:
+            for raw in lines:
+                line = raw.decode(errors='replace').strip()
+                if summary_filter(line): summary.append(line)
+
+    with open(log_file, 'ab', buffering=1 << 16) as log:
+        log.write(f"[{datetime.now().strftime('%H:%M:%S')}] Executing: {cmd}\nOutput:\n".encode())
+        try:
+            process = subprocess.Popen(
+                cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                bufsize=0, env=child_env(env_vars)
+            )
+            # Read whatever the pipe holds in one syscall rather than filling
+            # a fixed-size buffer, and split lines ourselves.
+            fd = process.stdout.fileno()
+            pending = b""
+            for chunk in iter(lambda: os.read(fd, 1 << 16), b''):
+                log.write(chunk)
+                lines = (pending + chunk).split(b'\n')
+                pending = lines.pop()
+                collect(lines)
+            if pending:
+                log.write(b'\n')
+                collect([pending])
+            process.wait()
+            success = process.returncode == 0
+        except Exception as e:
+            success = False
+            tail.append(str(e).encode())
+
+        if spinner: stop_progress()
+
         status = "SUCCESS" if success else "ERROR"
-        f.write(f"[{datetime.now().strftime('%H:%M:%S')}] {operation} - {status}\n")
-        f.write("Full Output:\n" + "\n".join(f"  {line}" for line in output_lines) + "\n")
+        log.write(f"[{datetime.now().strftime('%H:%M:%S')}] {operation} - {status}\n".encode())
 
+    output_lines = [line.decode(errors='replace').strip() for line in tail]
     if success:
         print(f"{OK} {operation} completed successfully!")
-    else:
-        print(f"{ERR} {operation} failed!")
-        print("Error details (last 5 lines):")
-        for line in output_lines[-5:]:
-            print(f"  {line}")
-            
+        return success, list(summary) if summary_filter else output_lines
+    if show_errors:
+        report_failure(operation, output_lines)
     return success, output_lines
 
+# ====== RCLONE REMOTE CONTROL ======
+
+_RC_URL = re.compile(rb'Serving remote control on (http://127\.0\.0\.1:(\d+))')
+# Requests go straight to the loopback daemon, never through an HTTP proxy.
+_RC_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+def start_rclone_rc(timeout=10):
+    """Start a background `rclone rcd` so probes reuse one rclone process."""
+    global rclone_rc
+    user, password = "manual-nas", secrets.token_urlsafe(16)
+    try:
+        process = subprocess.Popen(
+            ["rclone", "rcd", "--rc-addr=127.0.0.1:0"],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            env=child_env({"RCLONE_RC_USER": user, "RCLONE_RC_PASS": password})
+        )
+    except Exception:
+        return False
+
+    # The daemon picks a free port and announces it on stderr.
+    fd = process.stderr.fileno()
+    deadline = time.monotonic() + timeout
+    banner = b""
+    match = None
+    while not match:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            break
+        chunk = os.read(fd, 4096)
+        if not chunk:
+            break
+        banner += chunk
+        match = _RC_URL.search(banner)
+
+    if not match or int(match.group(2)) == 0:
+        process.kill()
+        process.wait()
+        return False
+
+    auth = base64.b64encode(f"{user}:{password}".encode()).decode()
+    rclone_rc = {"process": process, "url": match.group(1).decode(), "auth": f"Basic {auth}"}
+    atexit.register(stop_rclone_rc)
+    return True
+
+def stop_rclone_rc():
+    """Shut down the background rclone daemon, if running."""
+    global rclone_rc
+    if not rclone_rc:
+        return
+    process = rclone_rc["process"]
+    rclone_rc = None
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+def rclone_rc_call(method, params=None):
+    """Call a method on the rclone daemon, returning (success, response)."""
+    request = urllib.request.Request(
+        f"{rclone_rc['url']}/{method}", data=json.dumps(params or {}).encode(),
+        headers={"Content-Type": "application/json", "Authorization": rclone_rc["auth"]}
+    )
+    try:
+        with _RC_OPENER.open(request) as response:
+            return True, json.load(response)
+    except Exception:
+        return False, None
+
+def rclone_list_remotes():
+    """List configured rclone remotes, returning (success, remotes)."""
+    if rclone_rc:
+        success, response = rclone_rc_call("config/listremotes")
+        return success, (response or {}).get("remotes") or []
+    success, output = run_cmd(["rclone", "listremotes"])
+    return success, [r.rstrip(':') for r in output.split('\n') if r.strip()]
+
+def rclone_dir_exists(path):
+    """Check whether a local or remote path exists as a directory."""
+    if rclone_rc:
+        params = {"fs": path, "remote": "", "opt": {"dirsOnly": True, "noModTime": True}}
+        return rclone_rc_call("operations/list", params)[0]
+    return run_cmd(["rclone", "lsd", path], discard_output=True)[0]
+
 # ====== UI & INPUT HELPERS ======
 
 def confirm(prompt):
@@ -130,8 +284,7 @@ def get_password(prompt, salt):
     """Get password or generate a random one."""
     pwd = input(f"{CYAN}{prompt} [Press Enter to auto-generate]: {RESET}").strip()
     if pwd == "":
-        chars = string.ascii_letters + string.digits
-        pwd = f"{salt}_{''.join(random.choice(chars) for _ in range(12))}"
+        pwd = f"{salt}_{secrets.token_urlsafe(12)}"
         print(f"{INFO} Generated password.") # Password shown in final summary
     return pwd
 
@@ -156,25 +309,33 @@ def format_time(seconds):
     h, m = divmod(m, 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
 
+def _spin(sig=None, frame=None):
+    """Draw one spinner frame; runs as the SIGALRM handler."""
+    global _spinner_i, _spinner_sec, _spinner_elapsed
+    if not current_operation: return
+    # The elapsed time only changes once a second; reformat it only then.
+    sec = int(time.monotonic() - start_time) if start_time else 0
+    if sec != _spinner_sec:
+        _spinner_sec, _spinner_elapsed = sec, format_time(sec)
+    out = sys.stdout.buffer
+    out.write(_SPINNER_FRAMES[_spinner_i % 10] + f"{current_operation} - {_spinner_elapsed}".encode())
+    out.flush()
+    _spinner_i += 1
+
 def show_progress(operation):
-    """Show a CLI progress spinner."""
-    global current_operation
+    """Show a CLI progress spinner, redrawn by an interval timer."""
+    global current_operation, _spinner_i
     current_operation = operation
-    
-    def animate():
-        chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-        i = 0
-        while current_operation:
-            elapsed = time.time() - start_time if start_time else 0
-            print(f"\r{PROG} {chars[i % len(chars)]} {current_operation} - {format_time(elapsed)}", end="", flush=True)
-            time.sleep(0.1)
-            i += 1
-    
-    threading.Thread(target=animate, daemon=True).start()
+    _spinner_i = 0
+    sys.stdout.flush()
+    _spin()
+    signal.signal(signal.SIGALRM, _spin)
+    signal.setitimer(signal.ITIMER_REAL, _SPINNER_INTERVAL, _SPINNER_INTERVAL)
 
 def stop_progress():
     """Stop the progress spinner."""
     global current_operation
+    signal.setitimer(signal.ITIMER_REAL, 0)
     current_operation = ""
     print()
 
@@ -195,12 +356,13 @@ def check_tools():
 def check_rclone_config():
     """Check if rclone has configured remotes."""
     print(f"{INFO} Checking rclone configuration...")
-    success, remotes = run_cmd("rclone listremotes")
+    start_rclone_rc()
+    success, remotes = rclone_list_remotes()
     if not success or not remotes:
         print(f"\n{WARN} Rclone has no configured cloud remotes.")
         return []
     print(f"{OK} Rclone is configured.")
-    return [r.rstrip(':') for r in remotes.split('\n') if r.strip()]
+    return remotes
 
 def handle_installation():
     """Handles the optional installation/update of the script as a command."""
@@ -210,7 +372,7 @@ def handle_installation():
         try:
             bin_dir = os.path.dirname(INSTALL_PATH)
             os.makedirs(bin_dir, exist_ok=True)
-            shutil.copy(SCRIPT_PATH, INSTALL_PATH)
+            shutil.copyfile(SCRIPT_PATH, INSTALL_PATH)
             os.chmod(INSTALL_PATH, 0o755)
             status = "updated" if is_installed else "installed"
             print(f"{OK} Command '{COMMAND_NAME}' has been {status} successfully!")
@@ -236,70 +398,93 @@ def handle_installation():
 
 # ====== CORE LOGIC FUNCTIONS ======
 
-def handle_secure_backup(src_path, normalized_name, password, dest_type, dest_value, log_file):
-    """Handles the secure backup workflow using Restic."""
+def is_restic_summary(line):
+    """Match the totals restic prints at the end of a backup."""
+    return line.lower().startswith(('files', 'dirs', 'added', 'processed', 'snapshot'))
+
+def handle_secure_backup(src_path, normalized_name, password, dest_type, dest_value):
+    """Handles the secure backup prompts; returns a job to run it, or None."""
     custom_path = get_custom_destination_path("manual_nas_encrypted")
     repo_name = f"{normalized_name}_encrypted"
     
     if dest_type == "cloud":
         repo_path = f"rclone:{dest_value}:{custom_path}/{repo_name}"
     else:
-        disk_base_path = os.path.join(f"/run/media/{os.getenv('USER')}", dest_value)
+        disk_base_path = os.path.join(_MEDIA_PATH, dest_value)
         repo_path = os.path.join(disk_base_path, custom_path, repo_name)
 
     print(f"\n{INFO} Secure Backup Repository: {repo_path}")
     backup_passwords[repo_path] = password
     env_vars = {"RESTIC_PASSWORD": password}
     
-    repo_exists, _ = run_cmd(f"restic --repo '{repo_path}' snapshots --last 1", env_vars=env_vars)
-    backup_type = "Incremental" if repo_exists else "Initial"
-    
-    if not confirm(f"Proceed with {backup_type} backup to {dest_value}?"):
-        return False, None
-    
-    if not repo_exists:
+    if not confirm(f"Proceed with secure backup to {dest_value}?"):
+        return None
+    return partial(run_secure_backup, src_path, repo_path, dest_value, env_vars)
+
+def run_secure_backup(src_path, repo_path, dest_value, env_vars, log_file, spinner=True):
+    """Runs a Restic backup, initializing the repository if needed."""
+    # Try the backup straight away: an existing repository (the usual,
+    # incremental case) needs no separate probe, and a missing one is only
+    # initialized once restic reports it.
+    backup_cmd = f"restic backup '{src_path}' --repo '{repo_path}' --verbose"
+    backup_type = "Incremental"
+    operation = f"Backup to {dest_value}"
+    success, output = run_cmd_with_progress(backup_cmd, operation, log_file, env_vars, show_errors=False,
+                                            summary_filter=is_restic_summary, spinner=spinner)
+
+    if not success:
+        if not any(marker in line for line in output for marker in RESTIC_NO_REPO):
+            report_failure(operation, output)
+            return False, None
+        print(f"{INFO} No repository found on {dest_value}, creating a new one.")
         init_cmd = f"restic --repo '{repo_path}' init"
-        success, _ = run_cmd_with_progress(init_cmd, f"Initializing repo on {dest_value}", log_file, env_vars)
+        success, _ = run_cmd_with_progress(init_cmd, f"Initializing repo on {dest_value}", log_file, env_vars,
+                                           spinner=spinner)
         if not success: return False, None
-    
-    backup_cmd = f"restic backup '{src_path}' --repo '{repo_path}' --verbose"
-    success, output = run_cmd_with_progress(backup_cmd, f"{backup_type} backup to {dest_value}", log_file, env_vars)
-    summary = [line for line in output[-10:] if any(k in line.lower() for k in ['files', 'dirs', 'added', 'processed', 'snapshot'])]
-    
-    return success, {"destination": repo_path, "summary": summary}
+        backup_type = "Initial"
+        success, output = run_cmd_with_progress(backup_cmd, f"{backup_type} backup to {dest_value}", log_file, env_vars,
+                                                summary_filter=is_restic_summary, spinner=spinner)
 
-def handle_simple_copy(src_path, normalized_name, dest_type, dest_value, log_file):
-    """Handles the simple, non-encrypted, incremental copy workflow using Rclone."""
+    return success, {"destination": repo_path, "type": backup_type, "summary": output}
+
+def handle_simple_copy(src_path, normalized_name, dest_type, dest_value):
+    """Handles the simple copy prompts; returns a job to run it, or None."""
     custom_path = get_custom_destination_path("manual_nas_backup")
     backup_name = f"{normalized_name}_backup"
     
     if dest_type == "cloud":
         project_path = f"{dest_value}:{custom_path}/{backup_name}"
     else:
-        disk_base_path = os.path.join(f"/run/media/{os.getenv('USER')}", dest_value)
+        disk_base_path = os.path.join(_MEDIA_PATH, dest_value)
         project_path = os.path.join(disk_base_path, custom_path, backup_name)
 
-    if run_cmd(f"rclone lsd '{project_path}'")[0]:
+    if rclone_dir_exists(project_path):
         print(f"{WARN} A folder for '{backup_name}' already exists at the destination.")
         if not confirm("Do you want to merge/update files into it? (N creates a duplicated folder)"):
             project_path = f"{project_path}_duplicated_{datetime.now().strftime('%Y%m%d')}"
             print(f"{INFO} A new folder will be used: {os.path.basename(project_path)}")
     
     if not confirm(f"Proceed with simple copy to {dest_value}?"):
-        return False, None
+        return None
+    return partial(run_simple_copy, src_path, project_path, dest_value)
 
+def run_simple_copy(src_path, project_path, dest_value, log_file, spinner=True):
+    """Runs the simple, non-encrypted, incremental copy using Rclone."""
     copy_cmd = f"rclone copy '{src_path}' '{project_path}' --progress --update --create-empty-src-dirs"
-    success, output = run_cmd_with_progress(copy_cmd, f"Simple copy to {dest_value}", log_file)
-    summary_lines = [line for line in output if "Transferred" in line or "Errors" in line or "Checks" in line]
-    summary = summary_lines[-3:] if summary_lines else ["No summary available."]
-    
+    success, output = run_cmd_with_progress(
+        copy_cmd, f"Simple copy to {dest_value}", log_file,
+        summary_filter=lambda line: "Transferred" in line or "Errors" in line or "Checks" in line, summary_max=3,
+        spinner=spinner
+    )
+    summary = output if output else ["No summary available."]
+
     return success, {"destination": project_path, "summary": summary}
 
 # ====== MAIN FUNCTION ======
 def main():
     global start_time
     
-    os.system("clear")
+    sys.stdout.write("\033[2J\033[H"); sys.stdout.flush()
     print(f"{BOLD}{CYAN}✨ Manual NAS Backup Tool by Daury DiCaprio - v0.001 ✨{RESET}")
     print(f"\n{INFO} This tool helps you create two types of backups:")
     print(f"  1. {BOLD}Secure Backups:{RESET} Ideal for safety. Encrypted, versioned, and space-efficient.")
@@ -317,8 +502,7 @@ def main():
         print(f"{ERR} Invalid option. Exiting."); sys.exit(1)
     
     print(f"\n{BOLD}📂 Select source folder:{RESET}")
-    home = os.path.expanduser("~")
-    folders = sorted([f for f in os.listdir(home) if os.path.isdir(os.path.join(home, f))])
+    folders = list_dirs(_HOME)
     
     print(f"{YELLOW}0) Enter a custom path{RESET}")
     for i, folder in enumerate(folders, 1): print(f"{i}) {folder}")
@@ -326,11 +510,13 @@ def main():
     folder_choice = get_input("Select a folder")
     
     try:
-        src_path = os.path.join(home, get_input(f"Enter path relative to Home ('{home}')")) if folder_choice == "0" else os.path.join(home, folders[int(folder_choice) - 1])
+        src_path = os.path.join(_HOME, get_input(f"Enter path relative to Home ('{_HOME}')")) if folder_choice == "0" else os.path.join(_HOME, folders[int(folder_choice) - 1])
     except (ValueError, IndexError):
         print(f"{ERR} Invalid selection."); sys.exit(1)
 
-    if not os.path.exists(src_path):
+    # Listed folders were just read from the home directory; only a typed-in
+    # path still needs checking.
+    if folder_choice == "0" and not os.path.exists(src_path):
         print(f"{ERR} Source folder does not exist: {src_path}"); sys.exit(1)
     
     normalized_name = normalize_name(os.path.basename(src_path))
@@ -340,8 +526,7 @@ def main():
     print(f"\n{BOLD}💾 Select PRIMARY destination:{RESET}")
     print(f"{INFO} To add more cloud options, first run: {BOLD}rclone config{RESET}")
     
-    media_path = f"/run/media/{os.getenv('USER')}"
-    disks = [d for d in os.listdir(media_path) if os.path.isdir(os.path.join(media_path, d))] if os.path.exists(media_path) else []
+    disks = list_dirs(_MEDIA_PATH)
     
     options = {}
     idx = 1
@@ -371,60 +556,78 @@ def main():
 
     destinations.sort(key=lambda x: x[0] == 'cloud')
         
-    log_dir = os.path.join(home, "manual_nas_logs")
-    os.makedirs(log_dir, exist_ok=True)
-    log_file = os.path.join(log_dir, f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-    
-    start_time = time.time()
-    
     password = None
     if choice == '1':
         password = get_password("Enter password for secure repository", normalized_name)
 
-    results = []
+    # Ask everything up front so the backups themselves can run unattended.
+    jobs = []
     for dest_type, dest_value in destinations:
-        handler = handle_secure_backup if choice == '1' else handle_simple_copy
-        args = (src_path, normalized_name, password, dest_type, dest_value, log_file) if choice == '1' else (src_path, normalized_name, dest_type, dest_value, log_file)
-        
-        success, result_data = handler(*args)
-        if success:
-            results.append(result_data)
+        if choice == '1':
+            job = handle_secure_backup(src_path, normalized_name, password, dest_type, dest_value)
         else:
-            print(f"{ERR} Backup to {dest_value} failed. Halting subsequent backups.")
-            break
+            job = handle_simple_copy(src_path, normalized_name, dest_type, dest_value)
+        if job: jobs.append((dest_type, dest_value, job))
+        else: print(f"{INFO} Skipping {dest_value}.")
+
+    if not jobs:
+        print(f"\n{INFO} No backups to run."); sys.exit(0)
+
+    log_dir = os.path.join(_HOME, "manual_nas_logs")
+    os.makedirs(log_dir, exist_ok=True)
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+    start_time = time.monotonic()
+
+    if len(jobs) == 1:
+        log_files = [os.path.join(log_dir, f"backup_{stamp}.log")]
+        outcomes = [jobs[0][2](log_files[0])]
+    else:
+        # Each destination is an independent restic/rclone process, so run
+        # them side by side, each with its own log and no shared spinner.
+        log_files = [os.path.join(log_dir, f"backup_{stamp}_{dest_type}_{normalize_name(dest_value)}.log")
+                     for dest_type, dest_value, _ in jobs]
+        print(f"\n{INFO} Running {len(jobs)} backups in parallel...")
+        with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+            futures = [ex.submit(job, log_file, spinner=False) for (_, _, job), log_file in zip(jobs, log_files)]
+            outcomes = [future.result() for future in futures]
+
+    results = []
+    for (_, dest_value, _), (success, result_data) in zip(jobs, outcomes):
+        if success: results.append(result_data)
+        else: print(f"{ERR} Backup to {dest_value} failed.")
 
     if not results:
-        print(f"\n{ERR} No backups were completed. Check the log: {log_file}"); sys.exit(1)
+        print(f"\n{ERR} No backups were completed. Check the log: {', '.join(log_files)}"); sys.exit(1)
         
-    print(f"\n{OK} Operation finished in {format_time(time.time() - start_time)}!")
+    print(f"\n{OK} Operation finished in {format_time(time.monotonic() - start_time)}!")
     print(f"📂 Source:      {src_path}")
     
     for i, result in enumerate(results, 1):
         print(f"\n{INFO}--- Summary for Backup #{i} ---{RESET}")
         print(f"  💾 Destination: {result.get('destination')}")
+        if result.get('type'): print(f"  🔁 Backup type: {result['type']}")
         for line in result.get('summary', []): print(f"    {line}")
         
     if choice == '1' and password:
         # --- NEW: Enhanced Password Display Box ---
-        box_width = 60
-        print(f"\n{WARN}┌{'─' * box_width}┐{RESET}")
-        print(f"{WARN}│{' ' * box_width}│{RESET}")
-        
         title = "--- IMPORTANT RECOVERY PASSWORD ---"
-        print(f"{WARN}│{title.center(box_width)}│{RESET}")
-        print(f"{WARN}│{' ' * box_width}│{RESET}")
-
         pwd_line = f"{BOLD}{YELLOW}{password}{RESET}"
-        # This part is a bit tricky to center with color codes, so we'll left-align with padding
-        print(f"{WARN}│   Password: {pwd_line}{' ' * (box_width - 15 - len(password))}│{RESET}")
-        print(f"{WARN}│{' ' * box_width}│{RESET}")
-
         warning_line = "Save this in a secure password manager!"
-        print(f"{WARN}│{warning_line.center(box_width)}│{RESET}")
-        print(f"{WARN}│{' ' * box_width}│{RESET}")
-        print(f"{WARN}└{'─' * box_width}┘{RESET}")
-
-    print(f"\n📄 Detailed log saved to: {log_file}")
+        print("\n" + "\n".join([
+            _BOX_BORDER_TOP,
+            _BOX_BLANK_LINE,
+            f"{WARN}│{title.center(_BOX_WIDTH)}│{RESET}",
+            _BOX_BLANK_LINE,
+            # This part is a bit tricky to center with color codes, so we'll left-align with padding
+            f"{WARN}│   Password: {pwd_line}{' ' * (_BOX_WIDTH - 15 - len(password))}│{RESET}",
+            _BOX_BLANK_LINE,
+            f"{WARN}│{warning_line.center(_BOX_WIDTH)}│{RESET}",
+            _BOX_BLANK_LINE,
+            _BOX_BORDER_BOTTOM,
+        ]))
+
+    print(f"\n📄 Detailed log saved to: {', '.join(log_files)}")
     
     handle_installation()
     print(f"\n{GREEN}All done!{RESET}")